@@ -82,7 +82,8 @@ class FuncGen:
         self.anon = AnonymousFuncGen()
 
     def __getattr__(self, name: str) -> Callable[..., sge.Func]:
-        name = ".".join(filter(None, (self.namespace, name)))
+        if namespace := self.namespace:
+            name = f"{namespace}.{name}"
         return lambda *args, **kwargs: sg.func(name, *map(sge.convert, args), **kwargs)
 
     def __getitem__(self, key: str) -> Callable[..., sge.Func]:
@@ -147,6 +148,19 @@ TRUE = sge.true()
 STAR = sge.Star()
 
 
+_TRUNCATE_UNITS = {
+    "Y": "year",
+    "M": "month",
+    "W": "week",
+    "D": "day",
+    "h": "hour",
+    "m": "minute",
+    "s": "second",
+    "ms": "ms",
+    "us": "us",
+}
+
+
 @public
 class SQLGlotCompiler(abc.ABC):
     __slots__ = "agg", "f", "v"
@@ -273,10 +287,9 @@ class SQLGlotCompiler(abc.ABC):
             aliases[node] = alias
 
             alias = sg.to_identifier(alias, quoted=self.quoted)
-            try:
+            if isinstance(result, sge.Subqueryable):
                 return result.subquery(alias)
-            except AttributeError:
-                return result.as_(alias, quoted=self.quoted)
+            return result.as_(alias, quoted=self.quoted)
 
         # apply translate rules in topological order
         results = op.map(fn)
@@ -567,20 +580,8 @@ class SQLGlotCompiler(abc.ABC):
     @visit_node.register(ops.DateTruncate)
     @visit_node.register(ops.TimeTruncate)
     def visit_TimestampTruncate(self, op, *, arg, unit):
-        unit_mapping = {
-            "Y": "year",
-            "M": "month",
-            "W": "week",
-            "D": "day",
-            "h": "hour",
-            "m": "minute",
-            "s": "second",
-            "ms": "ms",
-            "us": "us",
-        }
-
-        if (unit := unit_mapping.get(unit.short)) is None:
-            raise com.UnsupportedOperationError(f"Unsupported truncate unit {unit}")
+        if (unit := _TRUNCATE_UNITS.get(unit.short)) is None:
+            raise com.UnsupportedOperationError(f"Unsupported truncate unit {op.unit}")
 
         return self.f.date_trunc(unit, arg)
 
@@ -1085,17 +1086,15 @@ class SQLGlotCompiler(abc.ABC):
             self._add_parens(raw_predicate, predicate)
             for raw_predicate, predicate in zip(op.predicates, predicates)
         )
-        try:
+        if isinstance(parent, sge.Select):
             return parent.where(*predicates)
-        except AttributeError:
-            return sg.select(STAR).from_(parent).where(*predicates)
+        return sg.select(STAR).from_(parent).where(*predicates)
 
     @visit_node.register(ops.Sort)
     def visit_Sort(self, op, *, parent, keys):
-        try:
+        if isinstance(parent, sge.Select):
             return parent.order_by(*keys)
-        except AttributeError:
-            return sg.select(STAR).from_(parent).order_by(*keys)
+        return sg.select(STAR).from_(parent).order_by(*keys)
 
     @visit_node.register(ops.Union)
     def visit_Union(self, op, *, left, right, distinct):
@@ -1200,10 +1199,9 @@ class SQLGlotCompiler(abc.ABC):
         if predicate is None:
             return parent
 
-        try:
+        if isinstance(parent, sge.Select):
             return parent.where(predicate)
-        except AttributeError:
-            return sg.select(STAR).from_(parent).where(predicate)
+        return sg.select(STAR).from_(parent).where(predicate)
 
     @visit_node.register(ops.FillNa)
     def visit_FillNa(self, op, *, parent, replacements):
@@ -1234,10 +1232,9 @@ class SQLGlotCompiler(abc.ABC):
         if isinstance(child, sge.Table):
             child = sg.select(STAR).from_(child)
 
-        try:
+        if isinstance(child, sge.Subqueryable):
             return child.subquery(name)
-        except AttributeError:
-            return child.as_(name)
+        return child.as_(name)
 
     @visit_node.register(ops.SQLStringView)
     def visit_SQLStringView(self, op, *, query: str, child, schema):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
+from functools import lru_cache, partial
 from typing import NoReturn
 
 import sqlglot as sg
@@ -178,7 +178,10 @@ class SqlglotType(TypeMapper):
         else:
             return sge.DataType(this=_to_sqlglot_types[type(dtype)])
 
+    # the same handful of type strings show up in every schema a backend
+    # reflects, and ibis types are immutable so they are safe to share
     @classmethod
+    @lru_cache(maxsize=256)
     def from_string(cls, text: str, nullable: bool | None = None) -> dt.DataType:
         if dtype := cls.unknown_type_strings.get(text.lower()):
             return dtype
@@ -28,7 +28,7 @@ ClickHouse.Generator.TRANSFORMS |= {
 
 class DataFusion(Postgres):
     class Generator(Postgres.Generator):
-        TRANSFORMS = Postgres.Generator.TRANSFORMS.copy() | {
+        TRANSFORMS = Postgres.Generator.TRANSFORMS | {
             sge.Select: transforms.preprocess([transforms.eliminate_qualify]),
             sge.Pow: rename_func("pow"),
             sge.IsNan: rename_func("isnan"),
@@ -42,7 +42,7 @@ class DataFusion(Postgres):
 
 class Druid(Postgres):
     class Generator(Postgres.Generator):
-        TRANSFORMS = Postgres.Generator.TRANSFORMS.copy() | {
+        TRANSFORMS = Postgres.Generator.TRANSFORMS | {
             sge.ApproxDistinct: rename_func("approx_count_distinct"),
             sge.Pow: rename_func("power"),
         }
@@ -62,19 +62,19 @@ def _interval(self, e, quote_arg=True):
 
 class Exasol(Postgres):
     class Generator(Postgres.Generator):
-        TRANSFORMS = Postgres.Generator.TRANSFORMS.copy() | {sge.Interval: _interval}
-        TYPE_MAPPING = Postgres.Generator.TYPE_MAPPING.copy() | {
+        TRANSFORMS = Postgres.Generator.TRANSFORMS | {sge.Interval: _interval}
+        TYPE_MAPPING = Postgres.Generator.TYPE_MAPPING | {
             sge.DataType.Type.TIMESTAMPTZ: "TIMESTAMP WITH LOCAL TIME ZONE",
         }
 
 
 class Flink(Hive):
     class Generator(Hive.Generator):
-        TYPE_MAPPING = Hive.Generator.TYPE_MAPPING.copy() | {
+        TYPE_MAPPING = Hive.Generator.TYPE_MAPPING | {
             sge.DataType.Type.TIME: "TIME",
         }
 
-        TRANSFORMS = Hive.Generator.TRANSFORMS.copy() | {
+        TRANSFORMS = Hive.Generator.TRANSFORMS | {
             sge.Stddev: rename_func("stddev_samp"),
             sge.StddevPop: rename_func("stddev_pop"),
             sge.StddevSamp: rename_func("stddev_samp"),
@@ -104,7 +104,7 @@ class Flink(Hive):
 
 class Impala(Hive):
     class Generator(Hive.Generator):
-        TRANSFORMS = Hive.Generator.TRANSFORMS.copy() | {
+        TRANSFORMS = Hive.Generator.TRANSFORMS | {
             sge.ApproxDistinct: rename_func("ndv"),
             sge.IsNan: rename_func("is_nan"),
             sge.IsInf: rename_func("is_inf"),
@@ -115,7 +115,7 @@ class Impala(Hive):
 
 class MSSQL(TSQL):
     class Generator(TSQL.Generator):
-        TRANSFORMS = TSQL.Generator.TRANSFORMS.copy() | {
+        TRANSFORMS = TSQL.Generator.TRANSFORMS | {
             sge.ApproxDistinct: rename_func("approx_count_distinct"),
             sge.Stddev: rename_func("stdevp"),
             sge.StddevPop: rename_func("stdevp"),
@@ -225,7 +225,7 @@ class RisingWave(Postgres):
         JSON_TYPE_REQUIRED_FOR_EXTRACTION = True
         SUPPORTS_UNLOGGED_TABLES = True
 
-        TYPE_MAPPING = Postgres.Generator.TYPE_MAPPING.copy() | {
+        TYPE_MAPPING = Postgres.Generator.TYPE_MAPPING | {
             sge.DataType.Type.TIMESTAMPTZ: "TIMESTAMPTZ"
         }
 
@@ -8,7 +8,12 @@ import sqlglot.expressions as sge
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.tests.strategies as its
-from ibis.backends.base.sqlglot.datatypes import DuckDBType, PostgresType, SqlglotType
+from ibis.backends.base.sqlglot.datatypes import (
+    DuckDBType,
+    PostgresType,
+    SqlglotType,
+    TrinoType,
+)
 
 
 def assert_dtype_roundtrip(ibis_type, sqlglot_expected=None):
@@ -74,3 +79,9 @@ def test_interval_without_unit():
         SqlglotType.from_string("INTERVAL")
     assert PostgresType.from_string("INTERVAL") == dt.Interval("s")
     assert DuckDBType.from_string("INTERVAL") == dt.Interval("us")
+
+
+def test_from_string_cached():
+    assert TrinoType.from_string("bigint") is TrinoType.from_string("bigint")
+    assert TrinoType.from_string("bigint", nullable=False) == dt.Int64(nullable=False)
+    assert DuckDBType.from_string("bigint") == PostgresType.from_string("bigint")
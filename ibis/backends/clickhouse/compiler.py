@@ -445,8 +445,9 @@ class ClickHouseCompiler(SQLGlotCompiler):
 
     @visit_node.register(ops.DayOfWeekIndex)
     def visit_DayOfWeekIndex(self, op, *, arg):
-        weekdays = len(calendar.day_name)
-        return (((self.f.toDayOfWeek(arg) - 1) % weekdays) + weekdays) % weekdays
+        # toDayOfWeek is 1-based starting on Monday, so no modular
+        # arithmetic is needed to map it onto [0, 6]
+        return self.f.toDayOfWeek(arg) - 1
 
     @visit_node.register(ops.DayOfWeekName)
     def visit_DayOfWeekName(self, op, *, arg):
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
     import pathlib
     from collections.abc import Mapping, MutableMapping
 
+_TABLE_TYPES = (dd.DataFrame, pd.DataFrame)
+
 
 class Backend(BasePandasBackend, NoUrl):
     name = "dask"
@@ -54,7 +56,7 @@ class Backend(BasePandasBackend, NoUrl):
             dictionary = {}
 
         for k, v in dictionary.items():
-            if not isinstance(v, (dd.DataFrame, pd.DataFrame)):
+            if not isinstance(v, _TABLE_TYPES):
                 raise TypeError(
                     f"Expected an instance of 'dask.dataframe.DataFrame' for {k!r},"
                     f" got an instance of '{type(v).__name__}' instead."
@@ -92,8 +94,7 @@ class Backend(BasePandasBackend, NoUrl):
         from ibis.backends.dask.executor import DaskExecutor
 
         self._validate_args(expr, limit, timecontext)
-        params = params or {}
-        params = {k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()}
+        params = self._prepare_params(params)
 
         return DaskExecutor.compile(expr.op(), backend=self, params=params)
 
@@ -108,8 +109,7 @@ class Backend(BasePandasBackend, NoUrl):
         from ibis.backends.dask.executor import DaskExecutor
 
         self._validate_args(expr, limit, timecontext)
-        params = params or {}
-        params = {k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()}
+        params = self._prepare_params(params)
 
         return DaskExecutor.execute(expr.op(), backend=self, params=params)
 
@@ -174,7 +174,17 @@ class Backend(BasePandasBackend, NoUrl):
     def table(self, name: str, schema: sch.Schema | None = None):
         df = self.dictionary[name]
         schema = schema or self.schemas.get(name, None)
-        schema = PandasData.infer_table(df.head(1), schema=schema)
+        # only object and categorical columns without an explicit type need
+        # values to infer their type, everything else can be read off the lazy
+        # frame's dtypes without computing a partition
+        known = schema or {}
+        if any(
+            col not in known
+            and (dtype == object or isinstance(dtype, pd.CategoricalDtype))
+            for col, dtype in df.dtypes.items()
+        ):
+            df = df.head(1)
+        schema = PandasData.infer_table(df, schema=schema)
         return ops.DatabaseTable(name, schema, self).to_expr()
 
     def _convert_object(self, obj) -> dd.DataFrame:
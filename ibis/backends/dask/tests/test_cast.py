@@ -14,7 +14,7 @@ from ibis.backends.conftest import is_older_than
 pytest.importorskip("dask.dataframe")
 from dask.dataframe.utils import tm  # noqa: E402
 
-TIMESTAMP = "2022-03-13 06:59:10.467417"
+TIMESTAMP = pd.Timestamp("2022-03-13 06:59:10.467417")
 
 
 @pytest.mark.parametrize("from_", ["plain_float64", "plain_int64"])
@@ -99,7 +99,7 @@ def test_cast_timestamp_column(t, df, column, to, expected):
     ],
 )
 def test_cast_timestamp_scalar_naive(con, to, expected):
-    literal_expr = ibis.literal(pd.Timestamp(TIMESTAMP))
+    literal_expr = ibis.literal(TIMESTAMP)
     value = literal_expr.cast(to)
     result = con.execute(value)
     raw = con.execute(literal_expr)
@@ -126,7 +126,7 @@ def test_cast_timestamp_scalar_naive(con, to, expected):
 )
 @pytest.mark.parametrize("tz", ["UTC", "America/New_York"])
 def test_cast_timestamp_scalar(to, expected, tz, con):
-    literal_expr = ibis.literal(pd.Timestamp(TIMESTAMP).tz_localize(tz))
+    literal_expr = ibis.literal(TIMESTAMP.tz_localize(tz))
     value = literal_expr.cast(to)
     result = con.execute(value)
     raw = con.execute(literal_expr)
@@ -161,12 +161,11 @@ def test_cast_to_decimal(t, pandas_df, type):
     expr = t.float64_as_strings.cast(type)
     result = expr.execute()
     context = decimal.Context(prec=type.precision)
+    quantum = decimal.Decimal(
+        "{}.{}".format("0" * (type.precision - type.scale), "0" * type.scale)
+    )
     expected = pandas_df.float64_as_strings.apply(
-        lambda x: context.create_decimal(x).quantize(
-            decimal.Decimal(
-                "{}.{}".format("0" * (type.precision - type.scale), "0" * type.scale)
-            )
-        )
+        lambda x: context.create_decimal(x).quantize(quantum)
     )
     tm.assert_series_equal(result, expected, check_names=False)
     assert all(
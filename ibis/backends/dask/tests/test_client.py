@@ -100,6 +100,41 @@ def test_datetime64_infer(client, unit):
     assert result == pd.Timestamp(value).to_pydatetime()
 
 
+@pytest.fixture
+def head_calls(monkeypatch):
+    calls = []
+    head = dd.DataFrame.head
+
+    def counting_head(self, *args, **kwargs):
+        calls.append(args)
+        return head(self, *args, **kwargs)
+
+    monkeypatch.setattr(dd.DataFrame, "head", counting_head)
+    return calls
+
+
+def test_table_schema_inferred_from_dtypes(npartitions, head_calls):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1.5, 2.5, None],
+            "c": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+        }
+    )
+    con = ibis.dask.connect({"t": dd.from_pandas(df, npartitions=npartitions)})
+    schema = con.table("t").schema()
+    assert schema == ibis.schema({"a": "int64", "b": "float64", "c": "timestamp"})
+    assert not head_calls
+
+
+def test_table_schema_inferred_from_values(npartitions, head_calls):
+    df = pd.DataFrame({"a": [1, 2, 3], "k": pd.Categorical(list("xyx"))})
+    con = ibis.dask.connect({"t": dd.from_pandas(df, npartitions=npartitions)})
+    schema = con.table("t").schema()
+    assert schema == ibis.schema({"a": "int64", "k": "string"})
+    assert head_calls
+
+
 def test_invalid_connection_parameter_types(npartitions):
     # Check that the user receives a TypeError with an informative message when
     # passing invalid an connection parameter to the backend.
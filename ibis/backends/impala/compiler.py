@@ -19,6 +19,18 @@ from ibis.backends.base.sqlglot.rewrites import (
     rewrite_sample_as_filter,
 )
 
+_TRUNCATE_UNITS = {
+    "Y": "YEAR",
+    "M": "MONTH",
+    "W": "WEEK",
+    "D": "DAY",
+    "h": "HOUR",
+    "m": "MINUTE",
+    "s": "SECOND",
+    "ms": "MILLISECONDS",
+    "us": "MICROSECONDS",
+}
+
 
 class ImpalaCompiler(SQLGlotCompiler):
     __slots__ = ()
@@ -258,20 +270,9 @@ class ImpalaCompiler(SQLGlotCompiler):
 
     @visit_node.register(ops.TimestampTruncate)
     def visit_TimestampTruncate(self, op, *, arg, unit):
-        units = {
-            "Y": "YEAR",
-            "M": "MONTH",
-            "W": "WEEK",
-            "D": "DAY",
-            "h": "HOUR",
-            "m": "MINUTE",
-            "s": "SECOND",
-            "ms": "MILLISECONDS",
-            "us": "MICROSECONDS",
-        }
         if unit.short == "Q":
             return self.f.trunc(arg, "Q")
-        if (impala_unit := units.get(unit.short)) is None:
+        if (impala_unit := _TRUNCATE_UNITS.get(unit.short)) is None:
             raise com.UnsupportedOperationError(
                 f"{unit!r} unit is not supported in timestamp/date truncate"
             )
@@ -93,6 +93,7 @@ class Backend(SQLGlotBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
             cur.execute("SET DATEFIRST 1")
 
         self.con = con
+        self._memtables = set()
 
     def get_schema(
         self, name: str, schema: str | None = None, database: str | None = None
@@ -234,6 +235,10 @@ class Backend(SQLGlotBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
         con = self.con
         cursor = con.cursor()
 
+        # arbitrary SQL can drop registered memtables or change the current
+        # database, so look them up on the server again afterwards
+        self._memtables.clear()
+
         try:
             cursor.execute(query, **kwargs)
         except Exception:
@@ -451,6 +456,18 @@ GO"""
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
+    def drop_table(
+        self,
+        name: str,
+        database: str | None = None,
+        schema: str | None = None,
+        force: bool = False,
+    ) -> None:
+        super().drop_table(name, database=database, schema=schema, force=force)
+        # memtables are only ever created in the default location
+        if database is None and schema is None:
+            self._memtables.discard(name)
+
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
@@ -459,8 +476,13 @@ GO"""
                 f"got null typed columns: {null_columns}"
             )
 
-        # only register if we haven't already done so
-        if (name := op.name) not in self.list_tables():
+        # only register if we haven't already done so; consult the set of
+        # tables registered through this connection before asking the server
+        name = op.name
+        if name in self._memtables:
+            return
+
+        if name not in self.list_tables():
             quoted = self.compiler.quoted
             column_defs = [
                 sg.exp.ColumnDef(
@@ -503,6 +525,8 @@ GO"""
                 if not df.empty:
                     cur.executemany(sql, data)
 
+        self._memtables.add(name)
+
     def _to_sqlglot(
         self, expr: ir.Expr, *, limit: str | None = None, params=None, **_: Any
     ):
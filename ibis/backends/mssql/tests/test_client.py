@@ -111,3 +111,18 @@ def test_glorious_length_function_hack(con, string):
     expr = lit.length()
     result = con.execute(expr)
     assert result == len(string)
+
+
+def test_memtable_reregistered_after_drop(con):
+    t = ibis.memtable({"a": [1, 2, 3]})
+    name = t.op().name
+
+    assert con.execute(t.count()) == 3
+
+    con.drop_table(name)
+    assert con.execute(t.count()) == 3
+
+    con.raw_sql(f"DROP TABLE [{name}]")
+    assert con.execute(t.count()) == 3
+
+    con.drop_table(name)
@@ -44,6 +44,17 @@ def rewrite_limit(_, **kwargs):
     return _
 
 
+_TRUNCATE_FORMATS = {
+    "s": "%Y-%m-%d %H:%i:%s",
+    "m": "%Y-%m-%d %H:%i:00",
+    "h": "%Y-%m-%d %H:00:00",
+    "D": "%Y-%m-%d",
+    # 'W': 'week',
+    "M": "%Y-%m-01",
+    "Y": "%Y-01-01",
+}
+
+
 @public
 class MySQLCompiler(SQLGlotCompiler):
     __slots__ = ()
@@ -290,16 +301,7 @@ class MySQLCompiler(SQLGlotCompiler):
     @visit_node.register(ops.DateTruncate)
     @visit_node.register(ops.TimestampTruncate)
     def visit_DateTimestampTruncate(self, op, *, arg, unit):
-        truncate_formats = {
-            "s": "%Y-%m-%d %H:%i:%s",
-            "m": "%Y-%m-%d %H:%i:00",
-            "h": "%Y-%m-%d %H:00:00",
-            "D": "%Y-%m-%d",
-            # 'W': 'week',
-            "M": "%Y-%m-01",
-            "Y": "%Y-01-01",
-        }
-        if (format := truncate_formats.get(unit.short)) is None:
+        if (format := _TRUNCATE_FORMATS.get(unit.short)) is None:
             raise com.UnsupportedOperationError(f"Unsupported truncate unit {op.unit}")
         return self.f.date_format(arg, format)
 
@@ -24,6 +24,22 @@ from ibis.backends.base.sqlglot.rewrites import (
     rewrite_sample_as_filter,
 )
 
+_TRUNC_UNITS = {
+    "Y": "year",
+    "M": "MONTH",
+    "W": "IW",
+    "D": "DDD",
+    "h": "HH",
+    "m": "MI",
+}
+
+_TIMESTAMP_TRUNC_UNITS = {
+    "s": "SS",
+    "ms": "SS.FF3",
+    "us": "SS.FF6",
+    "ns": "SS.FF9",
+}
+
 
 @public
 class OracleCompiler(SQLGlotCompiler):
@@ -330,23 +346,7 @@ class OracleCompiler(SQLGlotCompiler):
     @visit_node.register(ops.TimestampTruncate)
     @visit_node.register(ops.DateTruncate)
     def visit_DateTruncate(self, op, *, arg, unit):
-        trunc_unit_mapping = {
-            "Y": "year",
-            "M": "MONTH",
-            "W": "IW",
-            "D": "DDD",
-            "h": "HH",
-            "m": "MI",
-        }
-
-        timestamp_unit_mapping = {
-            "s": "SS",
-            "ms": "SS.FF3",
-            "us": "SS.FF6",
-            "ns": "SS.FF9",
-        }
-
-        if (unyt := timestamp_unit_mapping.get(unit.short)) is not None:
+        if (unyt := _TIMESTAMP_TRUNC_UNITS.get(unit.short)) is not None:
             # Oracle only has trunc(DATE) and that can't do sub-minute precision, but we can
             # handle those separately.
             return self.f.to_timestamp(
@@ -354,7 +354,7 @@ class OracleCompiler(SQLGlotCompiler):
                 f"YYYY-MM-DD HH24:MI:{unyt}",
             )
 
-        if (unyt := trunc_unit_mapping.get(unit.short)) is None:
+        if (unyt := _TRUNC_UNITS.get(unit.short)) is None:
             raise com.UnsupportedOperationError(f"Unsupported truncate unit {unit}")
 
         return self.f.trunc(arg, unyt)
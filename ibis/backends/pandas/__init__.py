@@ -53,6 +53,12 @@ class BasePandasBackend(BaseBackend, NoUrl):
         self.dictionary = dictionary or {}
         self.schemas: MutableMapping[str, sch.Schema] = {}
 
+    @staticmethod
+    def _prepare_params(params):
+        if not params:
+            return {}
+        return {k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()}
+
     def from_dataframe(
         self,
         df: pd.DataFrame,
@@ -319,8 +325,7 @@ class Backend(BasePandasBackend):
                 )
             )
 
-        params = params or {}
-        params = {k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()}
+        params = self._prepare_params(params)
 
         return PandasExecutor.execute(query.op(), backend=self, params=params)
 
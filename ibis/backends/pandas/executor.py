@@ -5,6 +5,8 @@ from functools import reduce
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 import ibis.backends.pandas.kernels as pandas_kernels
 import ibis.expr.operations as ops
@@ -15,6 +17,7 @@ from ibis.backends.pandas.helpers import (
     RangeFrame,
     RowsFrame,
     UngroupedFrame,
+    is_arrow_struct_dtype,
 )
 from ibis.backends.pandas.rewrites import (
     PandasAggregate,
@@ -154,6 +157,20 @@ class PandasExecutor(Dispatched, PandasUtils):
                     f"single-argument operation {typ}"
                 )
 
+    @classmethod
+    def visit(cls, op: ops.StructField, arg, field):
+        if isinstance(arg, pd.Series) and is_arrow_struct_dtype(arg.dtype):
+            # arrow stores each struct field as a separate child array, so
+            # picking one is a metadata operation rather than a python loop
+            values = pa.array(arg)
+            index = values.type.get_field_index(field)
+            child = pc.struct_field(values, [index])
+            return child.to_pandas().set_axis(arg.index).rename(op.name)
+
+        getter = pandas_kernels.struct_field_getter(field)
+        dtype = PandasType.from_ibis(op.dtype)
+        return cls.elementwise(getter, {"arg": arg}, name=op.name, dtype=dtype)
+
     @classmethod
     def visit(cls, op: ops.IsNan, arg):
         try:
@@ -6,6 +6,7 @@ from typing import Callable
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from ibis.util import gen_name
 
@@ -14,6 +15,16 @@ def isnull(obj):
     return obj is None or obj is pd.NA or (isinstance(obj, float) and math.isnan(obj))
 
 
+def is_arrow_struct_dtype(dtype):
+    """Return whether `dtype` is a pandas dtype backed by an arrow struct."""
+    arrow_dtype = getattr(pd, "ArrowDtype", None)
+    return (
+        arrow_dtype is not None
+        and isinstance(dtype, arrow_dtype)
+        and pa.types.is_struct(dtype.pyarrow_dtype)
+    )
+
+
 class PandasUtils:
     @classmethod
     def merge(cls, *args, **kwargs):
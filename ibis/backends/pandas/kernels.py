@@ -189,6 +189,29 @@ def safe_get(mapping, key, default=None):
     return _safe_method(mapping, "get", key, default)
 
 
+def struct_field_getter(field):
+    """Return a function extracting `field` from a struct value.
+
+    The `itemgetter` is bound once per field, so the per-element cost is a
+    single subscript instead of a `getattr` and method call.
+    """
+    getter = operator.itemgetter(field)
+
+    def get(value):
+        if value is None:
+            # a NULL struct scalar, columns skip NULL rows before getting here
+            return None
+        try:
+            result = getter(value)
+        except (TypeError, KeyError):
+            # TypeError: `value` is NaN/NA or not subscriptable
+            # KeyError: `field` is missing from `value`
+            return None
+        return None if isnull(result) else result
+
+    return get
+
+
 def safe_contains(mapping, key):
     return _safe_method(mapping, "__contains__", key)
 
@@ -457,7 +480,6 @@ elementwise = {
     ops.ExtractFragment: lambda x: getattr(urlsplit(x), "fragment", ""),
     ops.ExtractHost: lambda x: getattr(urlsplit(x), "hostname", ""),
     ops.ExtractUserInfo: extract_userinfo_elementwise,
-    ops.StructField: lambda x, field: safe_get(x, field),
     ops.ArrayLength: len,
     ops.ArrayFlatten: toolz.concat,
     ops.ArraySort: sorted,
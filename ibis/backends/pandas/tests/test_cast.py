@@ -11,7 +11,7 @@ import ibis.expr.datatypes as dt
 from ibis.backends.conftest import is_older_than
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 
-TIMESTAMP = "2022-03-13 06:59:10.467417"
+TIMESTAMP = pd.Timestamp("2022-03-13 06:59:10.467417")
 
 
 @pytest.mark.parametrize("from_", ["plain_float64", "plain_int64"])
@@ -116,7 +116,7 @@ def test_cast_timestamp_column(t, df, column, to, expected):
     ],
 )
 def test_cast_timestamp_scalar_naive(client, to, expected):
-    literal_expr = ibis.literal(pd.Timestamp(TIMESTAMP))
+    literal_expr = ibis.literal(TIMESTAMP)
     value = literal_expr.cast(to)
     result = client.execute(value)
     raw = client.execute(literal_expr)
@@ -143,7 +143,7 @@ def test_cast_timestamp_scalar_naive(client, to, expected):
 )
 @pytest.mark.parametrize("tz", ["UTC", "America/New_York"])
 def test_cast_timestamp_scalar(client, to, expected, tz):
-    literal_expr = ibis.literal(pd.Timestamp(TIMESTAMP).tz_localize(tz))
+    literal_expr = ibis.literal(TIMESTAMP.tz_localize(tz))
     value = literal_expr.cast(to)
     result = client.execute(value)
     raw = client.execute(literal_expr)
@@ -172,12 +172,11 @@ def test_cast_to_decimal(t, df, type):
     expr = t.float64_as_strings.cast(type)
     result = expr.execute()
     context = decimal.Context(prec=type.precision)
+    quantum = decimal.Decimal(
+        "{}.{}".format("0" * (type.precision - type.scale), "0" * type.scale)
+    )
     expected = df.float64_as_strings.apply(
-        lambda x: context.create_decimal(x).quantize(
-            decimal.Decimal(
-                "{}.{}".format("0" * (type.precision - type.scale), "0" * type.scale)
-            )
-        )
+        lambda x: context.create_decimal(x).quantize(quantum)
     )
     tm.assert_series_equal(result, expected)
     assert all(
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import OrderedDict
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ibis
@@ -58,6 +59,12 @@ def test_struct_field_literal(value):
     assert result == 0
 
 
+def test_struct_field_null_literal():
+    struct = ibis.literal(None, type="struct<fruit: string>")
+    con = ibis.pandas.connect()
+    assert con.execute(struct["fruit"]) is None
+
+
 def test_struct_field_series(struct_table):
     t = struct_table
     expr = t.s["fruit"]
@@ -86,3 +93,38 @@ def test_struct_field_series_group_by_value(struct_table):
             total=lambda df: df.total.astype(expr.total.type().to_pandas())
         ),
     )
+
+
+def test_struct_field_series_null_struct():
+    df = pd.DataFrame({"s": [{"fruit": "apple"}, None, {"fruit": None}]})
+    con = Backend().connect({"t": df})
+    t = con.table("t", schema={"s": dt.Struct({"fruit": dt.string})})
+    result = t.s["fruit"].execute()
+    expected = pd.Series(["apple", None, None], name="fruit")
+    tm.assert_series_equal(result, expected)
+
+
+def test_struct_field_series_arrow_dtype():
+    if not hasattr(pd, "ArrowDtype"):
+        pytest.skip("pandas ArrowDtype is not available")
+
+    values = pa.array([{"fruit": "apple"}, None, {"fruit": None}])
+    df = pd.DataFrame({"s": pd.Series(values, dtype=pd.ArrowDtype(values.type))})
+    con = Backend().connect({"t": df})
+    t = con.table("t")
+    result = t.s["fruit"].execute()
+    expected = pd.Series(["apple", None, None], name="fruit")
+    tm.assert_series_equal(result, expected)
+
+
+def test_struct_field_series_arrow_dtype_null_struct():
+    if not hasattr(pd, "ArrowDtype"):
+        pytest.skip("pandas ArrowDtype is not available")
+
+    values = pa.array([{"weight": 1}, None, {"weight": None}, {"weight": 3}])
+    df = pd.DataFrame({"s": pd.Series(values, dtype=pd.ArrowDtype(values.type))})
+    con = Backend().connect({"t": df})
+    t = con.table("t")
+    result = t.s["weight"].execute()
+    expected = pd.Series([1.0, None, None, 3.0], name="weight", dtype="float64")
+    tm.assert_series_equal(result, expected)
@@ -13,6 +13,19 @@ from ibis.backends.base.sqlglot.datatypes import RisingWaveType
 from ibis.backends.base.sqlglot.dialects import RisingWave
 from ibis.backends.postgres.compiler import PostgresCompiler
 
+_TRUNCATE_UNITS = {
+    "Y": "year",
+    "Q": "quarter",
+    "M": "month",
+    "W": "week",
+    "D": "day",
+    "h": "hour",
+    "m": "minute",
+    "s": "second",
+    "ms": "milliseconds",
+    "us": "microseconds",
+}
+
 
 @public
 class RisingwaveCompiler(PostgresCompiler):
@@ -39,21 +52,8 @@ class RisingwaveCompiler(PostgresCompiler):
     @visit_node.register(ops.DateTruncate)
     @visit_node.register(ops.TimeTruncate)
     def visit_TimestampTruncate(self, op, *, arg, unit):
-        unit_mapping = {
-            "Y": "year",
-            "Q": "quarter",
-            "M": "month",
-            "W": "week",
-            "D": "day",
-            "h": "hour",
-            "m": "minute",
-            "s": "second",
-            "ms": "milliseconds",
-            "us": "microseconds",
-        }
-
-        if (unit := unit_mapping.get(unit.short)) is None:
-            raise com.UnsupportedOperationError(f"Unsupported truncate unit {unit}")
+        if (unit := _TRUNCATE_UNITS.get(unit.short)) is None:
+            raise com.UnsupportedOperationError(f"Unsupported truncate unit {op.unit}")
 
         return self.f.date_trunc(unit, arg)
 
@@ -44,8 +44,11 @@ def test_rowid(backend):
     "column",
     ["string_col", "double_col", "date_string_col", "timestamp_col"],
 )
-def test_distinct_column(alltypes, df, column):
+def test_distinct_column(backend, alltypes, df, column):
     expr = alltypes[[column]].distinct()
-    result = expr.execute()
-    expected = df[[column]].drop_duplicates()
-    assert set(result) == set(expected)
+    result = expr.execute()[column]
+    expected = df[column].drop_duplicates()
+    backend.assert_series_equal(
+        result.sort_values().reset_index(drop=True),
+        expected.sort_values().reset_index(drop=True),
+    )
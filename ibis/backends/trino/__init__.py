@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 from functools import cached_property
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
@@ -31,6 +32,12 @@ if TYPE_CHECKING:
     import ibis.expr.operations as ops
 
 
+# metadata statements are registered in the client session only for the
+# duration of one call, so a process-wide counter is enough to keep their
+# names unique without generating a uuid each time
+_metadata_ids = itertools.count()
+
+
 class Backend(SQLGlotBackend, CanListDatabases, NoUrl):
     name = "trino"
     compiler = TrinoCompiler()
@@ -301,7 +308,7 @@ class Backend(SQLGlotBackend, CanListDatabases, NoUrl):
 
     @contextlib.contextmanager
     def _prepare_metadata(self, query: str) -> Iterator[dict[str, str]]:
-        name = util.gen_name(f"{self.name}_metadata")
+        name = f"ibis_{self.name}_metadata_{next(_metadata_ids):d}"
         with self.begin() as cur:
             cur.execute(f"PREPARE {name} FROM {query}")
             try:
@@ -310,18 +317,17 @@ class Backend(SQLGlotBackend, CanListDatabases, NoUrl):
             finally:
                 cur.execute(f"DEALLOCATE PREPARE {name}")
 
-    def _metadata(self, query: str) -> Iterator[tuple[str, dt.DataType]]:
+    def _metadata(self, query: str) -> list[tuple[str, dt.DataType]]:
+        from_string = self.compiler.type_mapper.from_string
+        # build the result eagerly so that the prepared statement isn't kept
+        # around while the caller consumes it, and iterating the result again
+        # doesn't describe the query again
         with self._prepare_metadata(query) as info:
-            yield from (
+            return [
                 # trino types appear to be always nullable
-                (
-                    name,
-                    self.compiler.type_mapper.from_string(trino_type).copy(
-                        nullable=True
-                    ),
-                )
+                (name, from_string(trino_type).copy(nullable=True))
                 for name, _, _, _, trino_type, *_ in info
-            )
+            ]
 
     def create_schema(
         self, name: str, database: str | None = None, force: bool = False
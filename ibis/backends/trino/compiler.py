@@ -25,6 +25,19 @@ from ibis.backends.base.sqlglot.rewrites import (
     rewrite_last_to_last_value,
 )
 
+_TRUNCATE_PRECISIONS = {
+    # ms unit is not yet officially documented but it works
+    "ms": "millisecond",
+    "s": "second",
+    "m": "minute",
+    "h": "hour",
+    "D": "day",
+    "W": "week",
+    "M": "month",
+    "Q": "quarter",
+    "Y": "year",
+}
+
 
 class TrinoCompiler(SQLGlotCompiler):
     __slots__ = ()
@@ -177,20 +190,7 @@ class TrinoCompiler(SQLGlotCompiler):
     @visit_node.register(ops.DateTruncate)
     @visit_node.register(ops.TimestampTruncate)
     def visit_DateTimestampTruncate(self, op, *, arg, unit):
-        _truncate_precisions = {
-            # ms unit is not yet officially documented but it works
-            "ms": "millisecond",
-            "s": "second",
-            "m": "minute",
-            "h": "hour",
-            "D": "day",
-            "W": "week",
-            "M": "month",
-            "Q": "quarter",
-            "Y": "year",
-        }
-
-        if (precision := _truncate_precisions.get(unit.short)) is None:
+        if (precision := _TRUNCATE_PRECISIONS.get(unit.short)) is None:
             raise com.UnsupportedOperationError(
                 f"Unsupported truncate unit {op.unit!r}"
             )
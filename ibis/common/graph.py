@@ -123,6 +123,17 @@ def _recursive_lookup(obj: Any, dct: dict) -> Any:
         return obj
 
 
+def _args_unchanged(node: Node, kwargs: dict[str, Any]) -> bool:
+    """Check whether none of the node's children were replaced.
+
+    Nodes are immutable, so if the looked up arguments are the same as the
+    node's own arguments the node can be reused as is instead of constructing
+    and validating an identical copy, sharing the untouched subtrees between
+    the input and the output graphs.
+    """
+    return node.__args__ == tuple(kwargs.values())
+
+
 def _coerce_finder(obj: FinderLike, context: Optional[dict] = None) -> Finder:
     """Coerce an object into a callable finder function.
 
@@ -180,7 +191,10 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
             # child arguments, this way we can propagate the rewritten nodes
             # upward in the hierarchy, using a specialized __recreate__ method
             # improves the performance by 17% compared node.__class__(**kwargs)
-            recreated = node.__recreate__(kwargs)
+            if _args_unchanged(node, kwargs):
+                recreated = node
+            else:
+                recreated = node.__recreate__(kwargs)
             if (result := obj.match(recreated, ctx)) is NoMatch:
                 return recreated
             else:
@@ -192,6 +206,8 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
             try:
                 return obj[node]
             except KeyError:
+                if _args_unchanged(node, kwargs):
+                    return node
                 return node.__class__(**kwargs)
     elif callable(obj):
         fn = obj
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import numbers
 from decimal import Decimal
 from enum import Enum, EnumMeta
 
-import dateutil.parser
 import dateutil.tz
 import pytz
 from public import public
@@ -216,8 +216,27 @@ def _from_str(value):
         return datetime.datetime.now()
     elif lower == "today":
         return datetime.datetime.today()
+    return _parse_datetime(value)
 
-    value = dateutil.parser.parse(value)
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    try:
+        # ISO 8601 strings are by far the most common input and parsing them
+        # with the standard library is much faster than with dateutil
+        return _parse_isoformat(value)
+    except ValueError:
+        import dateutil.parser
+
+        # not cached: dateutil fills in missing fields from the current date
+        value = dateutil.parser.parse(value)
+        return value.replace(tzinfo=normalize_timezone(value.tzinfo))
+
+
+# the same literals tend to be built over and over again, e.g. in generated
+# queries, and datetimes are immutable so the parsed values can be shared
+@functools.lru_cache(maxsize=4096)
+def _parse_isoformat(value: str) -> datetime.datetime:
+    value = datetime.datetime.fromisoformat(value)
     return value.replace(tzinfo=normalize_timezone(value.tzinfo))
 
 
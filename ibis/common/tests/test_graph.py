@@ -174,6 +174,30 @@ def test_replace_with_mapping():
     assert result == new_A
 
 
+def test_replace_reuses_unchanged_subtrees():
+    class Leaf(Concrete, Node):
+        value = InstanceOf(int)
+
+    class Pair(Concrete, Node):
+        left = InstanceOf(Node)
+        right = InstanceOf(Node)
+
+    one, two, three = Leaf(1), Leaf(2), Leaf(3)
+    untouched = Pair(one, two)
+    node = Pair(untouched, Pair(two, three))
+
+    rule = Eq(three) >> Leaf(4)
+    result = node.replace(rule)
+    assert result == Pair(untouched, Pair(two, Leaf(4)))
+    assert result.left is untouched
+    assert result.right.left is two
+
+    result = node.replace({three: Leaf(4)})
+    assert result.left is untouched
+
+    assert node.replace(Eq(Leaf(5)) >> Leaf(6)) is node
+
+
 def test_example():
     class Example(Annotable, Node):
         def __hash__(self):
@@ -176,6 +176,12 @@ def test_normalize_timezone(value, expected):
             "2017-01-01 00:00:00.000001+01:00",
             datetime(2017, 1, 1, 0, 0, 0, 1, tzinfo=dateutil.tz.tzoffset(None, 3600)),
         ),
+        (
+            "2017-01-01T00:00:00.000001Z",
+            datetime(2017, 1, 1, 0, 0, 0, 1, tzinfo=dateutil.tz.UTC),
+        ),
+        # non-ISO datetime string
+        ("Jan 1 2017 00:00:01", datetime(2017, 1, 1, 0, 0, 1)),
         # datetime string with timezone
         (
             "2017-01-01 00:00:00.000001 UTC",
@@ -218,6 +224,24 @@ def test_normalize_datetime_with_time(mocker):
     assert normalize_datetime(value) == expected
 
 
+def test_normalize_datetime_partial_string_uses_current_date(mocker):
+    def mock_now(year, month, day):
+        class MockDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(year, month, day, 12, 30)
+
+        return MockDatetime
+
+    mocker.patch("datetime.datetime", new=mock_now(2024, 7, 6))
+    assert normalize_datetime("10:00") == datetime(2024, 7, 6, 10, 0)
+
+    # dateutil fills in the missing fields from the current date, so the
+    # result must not be cached across calls
+    mocker.patch("datetime.datetime", new=mock_now(2030, 6, 1))
+    assert normalize_datetime("10:00") == datetime(2030, 6, 1, 10, 0)
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     [
@@ -59,20 +59,18 @@ __all__ = (
     "coalesce",
     "connect",
     "cross_join",
-    "cumulative_window",
     "cume_dist",
-    "rank",
-    "ntile",
-    "dense_rank",
-    "percent_rank",
+    "cumulative_window",
     "date",
-    "desc",
     "decompile",
     "deferred",
+    "dense_rank",
+    "desc",
     "difference",
     "dtype",
     "e",
     "Expr",
+    "following",
     "geo_area",
     "geo_as_binary",
     "geo_as_ewkb",
@@ -83,13 +81,15 @@ __all__ = (
     "geo_centroid",
     "geo_contains",
     "geo_contains_properly",
-    "geo_covers",
     "geo_covered_by",
+    "geo_covers",
     "geo_crosses",
     "geo_d_fully_within",
-    "geo_disjoint",
-    "geo_difference",
     "geo_d_within",
+    "geo_difference",
+    "geo_disjoint",
+    "geo_distance",
+    "geo_end_point",
     "geo_envelope",
     "geo_equals",
     "geo_geometry_n",
@@ -97,24 +97,22 @@ __all__ = (
     "geo_intersection",
     "geo_intersects",
     "geo_is_valid",
+    "geo_length",
     "geo_line_locate_point",
     "geo_line_merge",
     "geo_line_substring",
-    "geo_ordering_equals",
-    "geo_overlaps",
-    "geo_touches",
-    "geo_distance",
-    "geo_end_point",
-    "geo_length",
     "geo_max_distance",
     "geo_n_points",
     "geo_n_rings",
+    "geo_ordering_equals",
+    "geo_overlaps",
     "geo_perimeter",
     "geo_point",
     "geo_point_n",
     "geo_simplify",
     "geo_srid",
     "geo_start_point",
+    "geo_touches",
     "geo_transform",
     "geo_unary_union",
     "geo_union",
@@ -140,14 +138,18 @@ __all__ = (
     "NA",
     "negate",
     "now",
+    "ntile",
     "null",
     "or_",
     "param",
     "parse_sql",
+    "percent_rank",
     "pi",
+    "preceding",
     "random",
     "range",
     "range_window",
+    "rank",
     "read_csv",
     "read_delta",
     "read_json",
@@ -160,18 +162,16 @@ __all__ = (
     "selectors",
     "set_backend",
     "struct",
-    "to_sql",
     "table",
     "time",
     "timestamp",
+    "to_sql",
     "trailing_range_window",
     "trailing_window",
     "union",
     "watermark",
     "where",
     "window",
-    "preceding",
-    "following",
     "_",
 )
 
@@ -187,6 +187,15 @@ asof_join = ir.Table.asof_join
 e = ops.E().to_expr()
 pi = ops.Pi().to_expr()
 
+# operations without arguments are immutable and compare equal regardless of
+# identity, so build them once instead of validating a new instance per call
+_TIMESTAMP_NOW = ops.TimestampNow()
+_MIN_RANK = ops.MinRank()
+_DENSE_RANK = ops.DenseRank()
+_PERCENT_RANK = ops.PercentRank()
+_CUME_DIST = ops.CumeDist()
+_ROW_NUMBER = ops.RowNumber()
+
 
 NA = null()
 """The NULL scalar.
@@ -508,11 +517,19 @@ def _memtable_from_pyarrow_table(
     ).to_expr()
 
 
+# deferred expressions are immutable, so sort keys on the same column name can
+# be shared instead of rebuilding the resolver chain each time
+@functools.lru_cache(maxsize=1024)
+def _deferred_column_method_call(name, method_name):
+    return operator.methodcaller(method_name)(_[name])
+
+
 def _deferred_method_call(expr, method_name):
-    method = operator.methodcaller(method_name)
     if isinstance(expr, str):
-        value = _[expr]
-    elif isinstance(expr, Deferred):
+        return _deferred_column_method_call(expr, method_name)
+
+    method = operator.methodcaller(method_name)
+    if isinstance(expr, Deferred):
         value = expr
     elif callable(expr):
         value = expr(_)
@@ -690,6 +707,13 @@ def random() -> ir.FloatingScalar:
     return ops.RandomScalar().to_expr()
 
 
+# constructing a datatype validates its arguments which is a sizeable part of
+# building a timestamp literal, and only a handful of timezones are ever used
+@functools.lru_cache(maxsize=64)
+def _timestamp_dtype(timezone: str | None) -> dt.Timestamp:
+    return dt.Timestamp(timezone=timezone)
+
+
 @overload
 def timestamp(
     value_or_year: int | ir.IntegerValue | Deferred,
@@ -783,15 +807,19 @@ def timestamp(
                 "Timezone currently not supported when creating a timestamp from components"
             )
         return ops.TimestampFromYMDHMS(*args).to_expr()
-    elif isinstance(value_or_year, (numbers.Real, ir.IntegerValue)):
-        raise TypeError("Use ibis.literal(...).to_timestamp() instead")
-    elif isinstance(value_or_year, ir.Expr):
-        return value_or_year.cast(dt.Timestamp(timezone=timezone))
-    else:
-        value = normalize_datetime(value_or_year)
-        tzinfo = normalize_timezone(timezone or value.tzinfo)
-        timezone = tzinfo.tzname(value) if tzinfo is not None else None
-        return literal(value, type=dt.Timestamp(timezone=timezone))
+
+    # datetime objects (including pandas.Timestamp) are the most common input
+    # when building literals programmatically, so check for them first
+    if not isinstance(value_or_year, datetime.datetime):
+        if isinstance(value_or_year, (numbers.Real, ir.IntegerValue)):
+            raise TypeError("Use ibis.literal(...).to_timestamp() instead")
+        elif isinstance(value_or_year, ir.Expr):
+            return value_or_year.cast(_timestamp_dtype(timezone))
+
+    value = normalize_datetime(value_or_year)
+    tzinfo = normalize_timezone(timezone or value.tzinfo)
+    timezone = tzinfo.tzname(value) if tzinfo is not None else None
+    return literal(value, type=_timestamp_dtype(timezone))
 
 
 @overload
@@ -936,6 +964,21 @@ def time(value_or_hour, minute=None, second=None, /):
         return literal(value_or_hour, type=dt.time)
 
 
+_INTERVAL_KEYWORD_UNITS = (
+    ("nanoseconds", "ns"),
+    ("microseconds", "us"),
+    ("milliseconds", "ms"),
+    ("seconds", "s"),
+    ("minutes", "m"),
+    ("hours", "h"),
+    ("days", "D"),
+    ("weeks", "W"),
+    ("months", "M"),
+    ("quarters", "Q"),
+    ("years", "Y"),
+)
+
+
 def interval(
     value: int | datetime.timedelta | None = None,
     unit: str = "s",
@@ -989,21 +1032,21 @@ def interval(
         An interval expression
 
     """
-    keyword_value_unit = [
-        ("nanoseconds", nanoseconds, "ns"),
-        ("microseconds", microseconds, "us"),
-        ("milliseconds", milliseconds, "ms"),
-        ("seconds", seconds, "s"),
-        ("minutes", minutes, "m"),
-        ("hours", hours, "h"),
-        ("days", days, "D"),
-        ("weeks", weeks, "W"),
-        ("months", months, "M"),
-        ("quarters", quarters, "Q"),
-        ("years", years, "Y"),
-    ]
+    keyword_values = (
+        nanoseconds,
+        microseconds,
+        milliseconds,
+        seconds,
+        minutes,
+        hours,
+        days,
+        weeks,
+        months,
+        quarters,
+        years,
+    )
     if value is not None:
-        for kw, v, _abbrev in keyword_value_unit:
+        for (kw, _), v in zip(_INTERVAL_KEYWORD_UNITS, keyword_values):
             if v is not None:
                 raise TypeError(f"Cannot provide both 'value' and '{kw}'")
         if isinstance(value, datetime.timedelta):
@@ -1018,7 +1061,11 @@ def interval(
         else:
             raise TypeError("value must be an integer or timedelta")
     else:
-        components = [(v, u) for _, v, u in keyword_value_unit if v is not None]
+        components = [
+            (v, u)
+            for (_, u), v in zip(_INTERVAL_KEYWORD_UNITS, keyword_values)
+            if v is not None
+        ]
 
     # If no components, default to 0 s
     if not components:
@@ -1089,7 +1136,7 @@ def now() -> ir.TimestampScalar:
         An expression representing the current timestamp.
 
     """
-    return ops.TimestampNow().to_expr()
+    return _TIMESTAMP_NOW.to_expr()
 
 
 def rank() -> ir.IntegerColumn:
@@ -1122,7 +1169,7 @@ def rank() -> ir.IntegerColumn:
     └────────┴───────┘
 
     """
-    return ops.MinRank().to_expr()
+    return _MIN_RANK.to_expr()
 
 
 def dense_rank() -> ir.IntegerColumn:
@@ -1157,7 +1204,7 @@ def dense_rank() -> ir.IntegerColumn:
     └────────┴───────┘
 
     """
-    return ops.DenseRank().to_expr()
+    return _DENSE_RANK.to_expr()
 
 
 def percent_rank() -> ir.FloatingColumn:
@@ -1188,7 +1235,7 @@ def percent_rank() -> ir.FloatingColumn:
     └────────┴──────────┘
 
     """
-    return ops.PercentRank().to_expr()
+    return _PERCENT_RANK.to_expr()
 
 
 def cume_dist() -> ir.FloatingColumn:
@@ -1219,7 +1266,7 @@ def cume_dist() -> ir.FloatingColumn:
     └────────┴──────────┘
 
     """
-    return ops.CumeDist().to_expr()
+    return _CUME_DIST.to_expr()
 
 
 def ntile(buckets: int | ir.IntegerValue) -> ir.IntegerColumn:
@@ -1285,7 +1332,7 @@ def row_number() -> ir.IntegerColumn:
     └────────┴────────┘
 
     """
-    return ops.RowNumber().to_expr()
+    return _ROW_NUMBER.to_expr()
 
 
 def read_csv(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime as pydatetime
 import decimal as pydecimal
+import functools
 import numbers
 import uuid as pyuuid
 from abc import abstractmethod
@@ -67,6 +68,14 @@ def from_string(value):
     return DataType.from_string(value)
 
 
+# plain python classes are always hashable and only a handful of them are used
+# as type specs, while validating the constructed datatype is relatively costly
+@dtype.register(type)
+@functools.lru_cache(maxsize=64)
+def from_class(value, nullable=True):
+    return DataType.from_typehint(value, nullable)
+
+
 @dtype.register("numpy.dtype")
 def from_numpy_dtype(value, nullable=True):
     return DataType.from_numpy(value, nullable)
@@ -76,6 +76,12 @@ def test_dtype_from_classes(klass, expected):
     assert dt.dtype(klass) == expected
 
 
+def test_dtype_from_classes_nullable():
+    assert dt.dtype(int, nullable=False) == dt.Int64(nullable=False)
+    assert dt.dtype(dt.String, nullable=False) == dt.String(nullable=False)
+    assert dt.dtype(int) == dt.int64
+
+
 @pytest.mark.parametrize(
     ("klass", "lower", "upper"),
     [
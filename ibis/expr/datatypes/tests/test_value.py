@@ -4,7 +4,7 @@ import decimal
 import enum
 import json
 from collections import OrderedDict
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
 import numpy as np
 import pandas as pd
@@ -112,6 +112,24 @@ def test_infer_dtype(value, expected_dtype):
     assert dt.infer(value) == expected_dtype
 
 
+@pytest.mark.parametrize(
+    ("value", "expected_dtype"),
+    [
+        (0, dt.uint8),
+        (255, dt.uint8),
+        (256, dt.uint16),
+        (65535, dt.uint16),
+        (65536, dt.uint32),
+        (4294967296, dt.uint64),
+        (2**64, dt.uint64),
+        (-1, dt.int8),
+        (-129, dt.int16),
+    ],
+)
+def test_infer_integer_prefer_unsigned(value, expected_dtype):
+    assert dt.infer(value, prefer_unsigned=True) == expected_dtype
+
+
 def test_infer_mixed_type_fails():
     data = [1, "a"]
     with pytest.raises(TypeError):
@@ -201,6 +219,23 @@ def test_normalize_date(value, expected):
     assert normalized == expected
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("01:02:03", time(1, 2, 3)),
+        ("01:02:03.000004", time(1, 2, 3, 4)),
+        ("01:02:03+01:00", time(1, 2, 3)),
+        ("1:02:03", time(1, 2, 3)),
+        ("2019-01-01 01:02:03.000004", time(1, 2, 3, 4)),
+        (time(1, 2, 3), time(1, 2, 3)),
+        (datetime(2019, 1, 1, 1, 2, 3, 4), time(1, 2, 3, 4)),
+    ],
+)
+def test_normalize_time(value, expected):
+    normalized = dt.normalize(dt.time, value)
+    assert normalized == expected
+
+
 @pytest.mark.parametrize(
     ("dtype", "value", "expected"),
     [
@@ -7,6 +7,7 @@ import enum
 import ipaddress
 import json
 import uuid
+from bisect import bisect_left
 from collections.abc import Mapping, Sequence
 from functools import partial
 from operator import attrgetter
@@ -125,13 +126,27 @@ def infer_floating(value: float) -> dt.Float64:
     return dt.float64
 
 
+_SIGNED_INTEGERS = (dt.int8, dt.int16, dt.int32, dt.int64)
+_UNSIGNED_INTEGERS = (dt.uint8, dt.uint16, dt.uint32, dt.uint64)
+# number of value bits available in the integer types above
+_SIGNED_BITS = (7, 15, 31, 63)
+_UNSIGNED_BITS = (8, 16, 32, 64)
+
+
 @infer.register(int)
 def infer_integer(value: int, prefer_unsigned: bool = False) -> dt.Integer:
-    types = (dt.uint8, dt.uint16, dt.uint32, dt.uint64) if prefer_unsigned else ()
-    types += (dt.int8, dt.int16, dt.int32, dt.int64)
-    for dtype in types:
-        if dtype.bounds.lower <= value <= dtype.bounds.upper:
-            return dtype
+    # pick the smallest type by the bit length of the value instead of
+    # comparing against the bounds of every candidate type
+    if prefer_unsigned and value >= 0:
+        index = bisect_left(_UNSIGNED_BITS, value.bit_length())
+        if index < len(_UNSIGNED_INTEGERS):
+            return _UNSIGNED_INTEGERS[index]
+    else:
+        # ~value maps the negative range onto the non-negative one
+        bits = (value if value >= 0 else ~value).bit_length()
+        index = bisect_left(_SIGNED_BITS, bits)
+        if index < len(_SIGNED_INTEGERS):
+            return _SIGNED_INTEGERS[index]
     return dt.uint64 if prefer_unsigned else dt.int64
 
 
@@ -330,6 +345,13 @@ def normalize(typ, value):
     elif dtype.is_date():
         return normalize_datetime(value).date()
     elif dtype.is_time():
+        if isinstance(value, str):
+            # parsing a bare ISO time directly avoids a round trip through a
+            # full datetime parse; the fallback drops any offset, so do so here
+            try:
+                return datetime.time.fromisoformat(value).replace(tzinfo=None)
+            except ValueError:
+                pass
         return normalize_datetime(value).time()
     elif dtype.is_timestamp():
         value = normalize_datetime(value)
@@ -100,11 +100,11 @@ class Field(Value):
 
 def _check_integrity(values, allowed_parents):
     for value in values:
-        for rel in value.relations:
-            if rel not in allowed_parents:
-                raise IntegrityError(
-                    f"Cannot add {value!r} to projection, they belong to another relation"
-                )
+        # a single subset test instead of a membership test per relation
+        if not value.relations <= allowed_parents:
+            raise IntegrityError(
+                f"Cannot add {value!r} to projection, they belong to another relation"
+            )
 
 
 @public
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from itertools import product, starmap
 from typing import Optional
 
@@ -90,6 +91,10 @@ def shape_like(name):
 def _promote_integral_binop(exprs, op):
     import ibis.expr.operations as ops
 
+    # without literals the result only depends on the argument types
+    if not any(isinstance(arg, ops.Literal) for arg in exprs):
+        return _promote_integral_dtypes(tuple(arg.dtype for arg in exprs), op)
+
     bounds, dtypes = [], []
     for arg in exprs:
         dtypes.append(arg.dtype)
@@ -98,6 +103,18 @@ def _promote_integral_binop(exprs, op):
         else:
             bounds.append(arg.dtype.bounds)
 
+    return _promote_integral_bounds(dtypes, bounds, op)
+
+
+# datatypes are immutable and the same handful of type combinations show up
+# in every arithmetic expression, so avoid evaluating the bounds each time
+@functools.lru_cache(maxsize=1024)
+def _promote_integral_dtypes(dtypes, op):
+    bounds = [dtype.bounds for dtype in dtypes]
+    return _promote_integral_bounds(list(dtypes), bounds, op)
+
+
+def _promote_integral_bounds(dtypes, bounds, op):
     all_unsigned = dtypes and util.all_of(dtypes, dt.UnsignedInteger)
     # In some cases, the bounding type might be int8, even though neither
     # of the types are that small. We want to ensure the containing type is
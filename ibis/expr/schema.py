@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
 
 import ibis.expr.datatypes as dt
 from ibis.common.annotations import attribute
@@ -15,6 +16,8 @@ from ibis.util import deprecated, indent
 if TYPE_CHECKING:
     import pandas as pd
 
+_schemas: Mapping[tuple, Schema] = WeakValueDictionary()
+
 
 class Schema(Concrete, Coercible, MapSet):
     """An ordered mapping of str -> [datatype](./datatypes.qmd), used to hold a [Table](./expression-tables.qmd#ibis.expr.tables.Table)'s schema."""
@@ -48,6 +51,27 @@ class Schema(Concrete, Coercible, MapSet):
     def __getitem__(self, name: str) -> dt.DataType:
         return self.fields[name]
 
+    @classmethod
+    def __create__(cls, *args, **kwargs) -> Schema:
+        # schemas are frequently rebuilt from the very same fields, e.g. every
+        # relation derives its schema from its values, so reuse the existing
+        # instance instead of validating all the fields again; this is similar
+        # to `Singleton` but keyed on the ordered items since the argument is
+        # usually an unhashable dict
+        try:
+            (fields,) = args or kwargs.values()
+            key = (cls, tuple(fields.items()))
+            instance = _schemas.get(key)
+        except (ValueError, AttributeError, TypeError):
+            # not a single mapping with hashable items, let the signature
+            # validation deal with it
+            key = instance = None
+        if instance is None:
+            instance = super().__create__(*args, **kwargs)
+            if key is not None:
+                _schemas[key] = instance
+        return instance
+
     @classmethod
     def __coerce__(cls, value) -> Schema:
         if isinstance(value, cls):
@@ -56,11 +80,13 @@ class Schema(Concrete, Coercible, MapSet):
 
     @attribute
     def names(self):
-        return tuple(self.keys())
+        return tuple(self.fields.keys())
 
     @attribute
     def types(self):
-        return tuple(self.values())
+        # read the values off the underlying dict rather than the Mapping
+        # mixin's view, which goes through __getitem__ for every field
+        return tuple(self.fields.values())
 
     @attribute
     def _name_locs(self) -> dict[str, int]:
@@ -118,21 +144,17 @@ class Schema(Concrete, Coercible, MapSet):
 
         """
         pairs = list(values)
-        if len(pairs) == 0:
-            return cls({})
-
-        names, types = zip(*pairs)
+        fields = dict(pairs)
 
         # validate unique field names
-        name_locs = {v: i for i, v in enumerate(names)}
-        if len(name_locs) < len(names):
-            duplicate_names = list(names)
-            for v in name_locs:
+        if len(fields) < len(pairs):
+            duplicate_names = [name for name, _ in pairs]
+            for v in fields:
                 duplicate_names.remove(v)
             raise IntegrityError(f"Duplicate column name(s): {duplicate_names}")
 
         # construct the schema
-        return cls(dict(zip(names, types)))
+        return cls(fields)
 
     @classmethod
     def from_numpy(cls, numpy_schema):
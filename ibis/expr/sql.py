@@ -1,13 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import operator
-from functools import singledispatch
 
-import sqlglot as sg
-import sqlglot.expressions as sge
-import sqlglot.optimizer as sgo
-import sqlglot.planner as sgp
 from public import public
 
 import ibis
@@ -15,6 +11,7 @@ import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
+from ibis.common.dispatch import lazy_singledispatch
 from ibis.util import experimental
 
 
@@ -70,12 +67,14 @@ class Catalog(dict[str, sch.Schema]):
         return Catalog({**self, **updates})
 
 
-@singledispatch
+# sqlglot is only needed once SQL is actually parsed or transpiled, so the
+# implementations are registered by name to keep it out of `import ibis`
+@lazy_singledispatch
 def convert(step, catalog):
     raise TypeError(type(step))
 
 
-@convert.register(sgp.Scan)
+@convert.register("sqlglot.planner.Scan")
 def convert_scan(scan, catalog):
     catalog = catalog.overlay(scan)
 
@@ -95,7 +94,7 @@ def convert_scan(scan, catalog):
     return table
 
 
-@convert.register(sgp.Sort)
+@convert.register("sqlglot.planner.Sort")
 def convert_sort(sort, catalog):
     catalog = catalog.overlay(sort)
 
@@ -119,7 +118,7 @@ _join_types = {
 }
 
 
-@convert.register(sgp.Join)
+@convert.register("sqlglot.planner.Join")
 def convert_join(join, catalog):
     catalog = catalog.overlay(join)
 
@@ -154,7 +153,7 @@ def convert_join(join, catalog):
     return left_table
 
 
-@convert.register(sgp.Aggregate)
+@convert.register("sqlglot.planner.Aggregate")
 def convert_aggregate(agg, catalog):
     catalog = catalog.overlay(agg)
 
@@ -167,14 +166,17 @@ def convert_aggregate(agg, catalog):
     return table
 
 
-@convert.register(sge.Subquery)
+@convert.register("sqlglot.expressions.Subquery")
 def convert_subquery(subquery, catalog):
+    import sqlglot.optimizer as sgo
+    import sqlglot.planner as sgp
+
     tree = sgo.optimize(subquery.this, catalog.to_sqlglot(), rules=sgo.RULES)
     plan = sgp.Plan(tree)
     return convert(plan.root, catalog=catalog)
 
 
-@convert.register(sge.Literal)
+@convert.register("sqlglot.expressions.Literal")
 def convert_literal(literal, catalog):
     value = literal.this
     if literal.is_int:
@@ -184,62 +186,70 @@ def convert_literal(literal, catalog):
     return ibis.literal(value)
 
 
-@convert.register(sge.Boolean)
+@convert.register("sqlglot.expressions.Boolean")
 def convert_boolean(boolean, catalog):
     return ibis.literal(boolean.this)
 
 
-@convert.register(sge.Alias)
+@convert.register("sqlglot.expressions.Alias")
 def convert_alias(alias, catalog):
     this = convert(alias.this, catalog=catalog)
     return this.name(alias.alias)
 
 
-@convert.register(sge.Column)
+@convert.register("sqlglot.expressions.Column")
 def convert_column(column, catalog):
     table = catalog[column.table]
     return table[column.name]
 
 
-@convert.register(sge.Ordered)
+@convert.register("sqlglot.expressions.Ordered")
 def convert_ordered(ordered, catalog):
     this = convert(ordered.this, catalog=catalog)
     desc = ordered.args["desc"]  # not exposed as an attribute
     return ibis.desc(this) if desc else ibis.asc(this)
 
 
-_unary_operations = {
-    sge.Paren: lambda x: x,
-}
+@functools.cache
+def _unary_operations():
+    import sqlglot.expressions as sge
+
+    return {sge.Paren: lambda x: x}
 
 
-@convert.register(sge.Unary)
+@convert.register("sqlglot.expressions.Unary")
 def convert_unary(unary, catalog):
-    op = _unary_operations[type(unary)]
+    op = _unary_operations()[type(unary)]
     this = convert(unary.this, catalog=catalog)
     return op(this)
 
 
-_binary_operations = {
-    sge.LT: operator.lt,
-    sge.LTE: operator.le,
-    sge.GT: operator.gt,
-    sge.GTE: operator.ge,
-    sge.EQ: operator.eq,
-    sge.NEQ: operator.ne,
-    sge.Add: operator.add,
-    sge.Sub: operator.sub,
-    sge.Mul: operator.mul,
-    sge.Div: operator.truediv,
-    sge.Pow: operator.pow,
-    sge.And: operator.and_,
-    sge.Or: operator.or_,
-}
+@functools.cache
+def _binary_operations():
+    import sqlglot.expressions as sge
+
+    return {
+        sge.LT: operator.lt,
+        sge.LTE: operator.le,
+        sge.GT: operator.gt,
+        sge.GTE: operator.ge,
+        sge.EQ: operator.eq,
+        sge.NEQ: operator.ne,
+        sge.Add: operator.add,
+        sge.Sub: operator.sub,
+        sge.Mul: operator.mul,
+        sge.Div: operator.truediv,
+        sge.Pow: operator.pow,
+        sge.And: operator.and_,
+        sge.Or: operator.or_,
+    }
 
 
-@convert.register(sge.Binary)
+@convert.register("sqlglot.expressions.Binary")
 def convert_binary(binary, catalog):
-    op = _binary_operations[type(binary)]
+    import sqlglot.expressions as sge
+
+    op = _binary_operations()[type(binary)]
     this = convert(binary.this, catalog=catalog)
     expr = convert(binary.expression, catalog=catalog)
 
@@ -252,24 +262,28 @@ def convert_binary(binary, catalog):
     return op(this, expr)
 
 
-_reduction_methods = {
-    sge.Max: "max",
-    sge.Min: "min",
-    sge.Quantile: "quantile",
-    sge.Sum: "sum",
-    sge.Avg: "mean",
-    sge.Count: "count",
-}
+@functools.cache
+def _reduction_methods():
+    import sqlglot.expressions as sge
+
+    return {
+        sge.Max: "max",
+        sge.Min: "min",
+        sge.Quantile: "quantile",
+        sge.Sum: "sum",
+        sge.Avg: "mean",
+        sge.Count: "count",
+    }
 
 
-@convert.register(sge.AggFunc)
+@convert.register("sqlglot.expressions.AggFunc")
 def convert_sum(reduction, catalog):
-    method = _reduction_methods[type(reduction)]
+    method = _reduction_methods()[type(reduction)]
     this = convert(reduction.this, catalog=catalog)
     return getattr(this, method)()
 
 
-@convert.register(sge.In)
+@convert.register("sqlglot.expressions.In")
 def convert_in(in_, catalog):
     this = convert(in_.this, catalog=catalog)
     candidates = [convert(expression, catalog) for expression in in_.expressions]
@@ -296,6 +310,10 @@ def parse_sql(sqlstring, catalog, dialect=None):
     expr : ir.Expr
 
     """
+    import sqlglot as sg
+    import sqlglot.optimizer as sgo
+    import sqlglot.planner as sgp
+
     catalog = Catalog(
         {name: ibis.table(schema, name=name) for name, schema in catalog.items()}
     )
@@ -379,6 +397,8 @@ def to_sql(expr: ir.Expr, dialect: str | None = None, **kwargs) -> SQLString:
         else:
             read = write = getattr(backend, "dialect", dialect)
 
+    import sqlglot as sg
+
     sql = backend._to_sql(expr.unbind(), **kwargs)
     (pretty,) = sg.transpile(sql, read=read, write=write, pretty=True)
     return SQLString(pretty)
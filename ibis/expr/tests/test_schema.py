@@ -158,6 +158,20 @@ def test_empty_schema():
         assert repr(s) == "ibis.Schema {\n}"
 
 
+def test_schema_instances_are_reused():
+    s1 = sch.Schema({"a": "int64", "b": "string"})
+    s2 = sch.Schema(fields={"a": "int64", "b": "string"})
+    assert s1 is s2
+
+    # the order of the fields is significant
+    s3 = sch.Schema({"b": "string", "a": "int64"})
+    assert s3 is not s1
+    assert s3.names == ("b", "a")
+
+    s4 = sch.Schema({"a": dt.int64, "b": dt.string})
+    assert s4 == s1
+
+
 def test_nullable_output():
     s = sch.schema(
         [
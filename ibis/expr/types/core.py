@@ -34,6 +34,8 @@ if TYPE_CHECKING:
 class _FixedTextJupyterMixin(JupyterMixin):
     """JupyterMixin adds a spurious newline to text, this fixes the issue."""
 
+    __slots__ = ()
+
     def _repr_mimebundle_(self, *args, **kwargs):
         bundle = super()._repr_mimebundle_(*args, **kwargs)
         bundle["text/plain"] = bundle["text/plain"].rstrip()
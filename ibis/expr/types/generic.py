@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any, Literal
 
+import parsy
 from public import public
 
 import ibis
@@ -197,11 +198,19 @@ class Value(Expr):
         >>> ibis.literal("a string").cast("int64")  # doctest: +SKIP
         <error>
         """
-        op = ops.Cast(self, to=target_type)
+        try:
+            to = dt.dtype(target_type)
+        except (TypeError, parsy.ParseError):
+            # an unsupported object or an unparsable type string, let the
+            # operation's validation report the invalid type
+            to = target_type
+        else:
+            # noop case if passed type is the same, checked before constructing
+            # the operation since casting to the current type is very common
+            if to == self.type():
+                return self
 
-        if op.to == self.type():
-            # noop case if passed type is the same
-            return self
+        op = ops.Cast(self, to=to)
 
         if op.to.is_geospatial():
             from_geotype = self.type().geotype or "geometry"
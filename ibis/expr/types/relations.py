@@ -803,10 +803,11 @@ class Table(Expr, _FixedTextJupyterMixin):
         │ …         │
         └───────────┘
         """
-        try:
-            return self._get_column(key)
-        except com.IbisTypeError:
-            pass
+        # check the schema first rather than letting Field validation fail,
+        # since non-column lookups (hasattr() probes, IPython's _repr_*_
+        # checks, typos) are common and the error lists every column
+        if key in self.schema():
+            return ops.Field(self, key).to_expr()
 
         # A mapping of common attribute typos, mapping them to the proper name
         common_typos = {
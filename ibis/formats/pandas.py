@@ -122,13 +122,23 @@ class PandasData(DataMapper):
             )
 
         columns = []
+        unchanged = True
         for (_, series), dtype in zip(df.items(), schema.types):
-            columns.append(cls.convert_column(series, dtype))
-        df = cls.concat(columns, axis=1)
+            converted = cls.convert_column(series, dtype)
+            unchanged &= converted is series
+            columns.append(converted)
 
         # return data with the schema's columns which may be different than the
         # input columns
-        df.columns = schema.names
+        if unchanged:
+            # every column already has the expected dtype, so skip rebuilding
+            # the frame column by column and only relabel a shallow copy, since
+            # set_axis copies all the data by default
+            df = df.copy(deep=False)
+            df.columns = schema.names
+        else:
+            df = cls.concat(columns, axis=1)
+            df.columns = schema.names
 
         if geospatial_supported:
             from geopandas import GeoDataFrame
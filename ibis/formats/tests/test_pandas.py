@@ -431,3 +431,16 @@ def test_convert_dataframe_with_timezone():
     desired_schema = ibis.schema(dict(time='timestamp("EST")'))
     result = PandasData.convert_table(df.copy(), desired_schema)
     tm.assert_frame_equal(expected, result)
+
+
+def test_convert_dataframe_already_typed():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [1.0, 2.0, 3.0]})
+    schema = ibis.schema(dict(x="int64", y="float64"))
+    result = PandasData.convert_table(df, schema)
+
+    expected = pd.DataFrame({"x": [1, 2, 3], "y": [1.0, 2.0, 3.0]})
+    tm.assert_frame_equal(result, expected)
+
+    # the input frame is left untouched and its data isn't copied
+    assert list(df.columns) == ["a", "b"]
+    assert np.shares_memory(result["x"].to_numpy(), df["a"].to_numpy())
@@ -1630,6 +1630,11 @@ def test_pickle_table_expr():
     assert t1.equals(t0)
 
 
+def test_expressions_have_no_instance_dict(table):
+    for expr in [table, table.a, table.a + 1, table.a.sum()]:
+        assert not hasattr(expr, "__dict__")
+
+
 def test_pickle_table_node(table):
     n0 = table.op()
     assert_pickle_roundtrip(n0)
@@ -800,6 +800,25 @@ def test_zero_subtract_literal_promotions(table, op, left_fn, right_fn, ex_type)
     assert result.type() == dt.dtype(ex_type)
 
 
+@pytest.mark.parametrize(
+    ("op", "left", "right", "ex_type"),
+    [
+        (operator.add, "int8", "int16", "int32"),
+        (operator.mul, "int8", "int8", "int16"),
+        (operator.sub, "uint8", "uint16", "int32"),
+        (operator.add, "uint8", "int8", "int16"),
+        (operator.add, "int32", "int64", "int64"),
+    ],
+    ids=lambda arg: str(getattr(arg, "__name__", arg)),
+)
+def test_column_promotions(op, left, right, ex_type):
+    t = ibis.table({"x": left, "y": right})
+
+    # the promoted type is cached per argument types, so check it twice
+    assert op(t.x, t.y).type() == dt.dtype(ex_type)
+    assert op(t.x, t.y).type() == dt.dtype(ex_type)
+
+
 def test_substitute_dict():
     table = ibis.table([("foo", "string"), ("bar", "string")], "t1")
     subs = {"a": "one", "b": table.bar}
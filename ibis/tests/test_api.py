@@ -63,7 +63,7 @@ def test_multiple_backends(mocker):
         ibis.foo  # noqa: B018
 
 
-@pytest.mark.parametrize("module", ["pandas", "pyarrow"])
+@pytest.mark.parametrize("module", ["pandas", "pyarrow", "sqlglot"])
 def test_no_import(module):
     script = f"""
 import ibis
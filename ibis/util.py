@@ -25,12 +25,10 @@ from typing import (
 )
 from uuid import uuid4
 
-import toolz
-
 from ibis.common.typing import Coercible
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
     from numbers import Real
     from pathlib import Path
 
@@ -91,8 +89,14 @@ def is_one_of(values: Sequence[T], t: type[U]) -> Iterator[bool]:
     return (isinstance(x, t) for x in values)
 
 
-any_of = toolz.compose(any, is_one_of)
-all_of = toolz.compose(all, is_one_of)
+def any_of(values: Iterable[T], t: type[U]) -> bool:
+    """Check if any of the values is an instance of the given type."""
+    return any(isinstance(x, t) for x in values)
+
+
+def all_of(values: Iterable[T], t: type[U]) -> bool:
+    """Check if all of the values are instances of the given type."""
+    return all(isinstance(x, t) for x in values)
 
 
 def promote_list(val: V | Sequence[V]) -> list[V]: